@@ -8,9 +8,22 @@ from literator.config import Config
 
 setup_logging()
 
-# Expose specific common objects
-# Ruff disabled: Forcing setup of logging and config first
-from literator.db.models import Paper, Author, Keyword  # noqa: E402
-from literator.api import get_api_client  # noqa: E402
+
+def __getattr__(name: str):
+    """Import the exposed models and API helpers on first access.
+
+    Loading them eagerly would create the database engine and API clients on
+    every import, including CLI startup.
+    """
+    if name in ("Paper", "Author", "Keyword"):
+        from literator.db import models
+
+        return getattr(models, name)
+    if name == "get_api_client":
+        from literator.api import get_api_client
+
+        return get_api_client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["Config", "Paper", "Author", "Keyword", "get_api_client"]
@@ -82,6 +82,15 @@ class APIClient(ABC):
     def search(self, query: str) -> List[Paper]:
         pass
 
+    def search_pages(self, query: str, **kwargs: Any) -> Iterator[List[Paper]]:
+        """Yield search results a page at a time, as they are received.
+
+        Clients that paginate should override this so callers can process
+        early pages while later ones are still being fetched. By default the
+        whole search is returned as a single page.
+        """
+        yield self.search(query, **kwargs)
+
     @abstractmethod
     def parse_results(self, entries: List[Dict[str, Any]]) -> List[Paper]:
         pass
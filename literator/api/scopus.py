@@ -1,14 +1,23 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
+from itertools import islice
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import requests
 
 from literator.api.base import APIClient
 from literator.db.models import Author, Paper
+from literator.utils.serialization import loads
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of result pages requested ahead of the one being parsed
+MAX_CONCURRENT_REQUESTS = 4
+
 
 class ScopusAPIClient(APIClient):
     """
@@ -16,6 +25,7 @@ class ScopusAPIClient(APIClient):
     This class extends the APIClient base class and provides specific functionality
     for searching and retrieving papers from Scopus's database. It handles API
     authentication, request formatting, response parsing, and pagination.
+    After the first page, the remaining pages are requested concurrently.
     Attributes:
         headers (dict): HTTP headers including API key and accept type for JSON
         max_results_per_request (int): Maximum number of results per API request
@@ -62,6 +72,25 @@ class ScopusAPIClient(APIClient):
         Returns:
             List[Paper]: A list of Paper objects matching the search criteria
         """
+        pages = self.search_pages(query, start_year, end_year, max_results)
+        return [paper for page in pages for paper in page]
+
+    def search_pages(
+        self,
+        query: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        max_results: int = 100,
+    ) -> Iterator[List[Paper]]:
+        """
+        Search Scopus for papers matching the query, yielding each page of
+        results in order as soon as it has been received and parsed.
+
+        Takes the same arguments as search().
+
+        Yields:
+            List[Paper]: The Paper objects of one page of results
+        """
         params = {
             "query": query,
             "count": min(max_results, self.max_results_per_request),
@@ -79,54 +108,96 @@ class ScopusAPIClient(APIClient):
         if date_restrictions:
             params["query"] += " AND " + " AND ".join(date_restrictions)
 
-        all_papers = []
-        total_fetched = 0
+        fetched_count = 0
+        page_size = params["count"]
 
         try:
-            while total_fetched < max_results:
-                params["start"] = total_fetched
-
-                logger.info(
-                    f"Fetching results {total_fetched + 1}-{total_fetched + params['count']}..."
-                )
-                response = requests.get(
-                    self.api_url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Check if there are results
-                if (
-                    "search-results" not in data
-                    or "entry" not in data["search-results"]
-                ):
-                    logger.warning("No results found in Scopus response")
-                    break
-
-                entries = data["search-results"]["entry"]
-                if not entries:
-                    break
-
-                # Parse results
-                batch_papers = self.parse_results(entries)
-                all_papers.extend(batch_papers)
-
-                total_fetched += len(entries)
-
-                # Check if we've reached the end
-                if len(entries) < params["count"]:
-                    break
-
-            logger.info(f"Total papers fetched from Scopus: {len(all_papers)}")
-            return all_papers
+            # The first page also reports how many results there are
+            with requests.Session() as session:
+                results = self._fetch_page(session, params, 0)
+            entries = results.get("entry")
+            if not entries:
+                logger.warning("No results found in Scopus response")
+                return
+
+            page = self.parse_results(entries)
+            fetched_count += len(page)
+            yield page
+
+            # Fetch any remaining pages concurrently, keeping their order
+            total_results = int(results.get("opensearch:totalResults", 0))
+            starts = range(page_size, min(max_results, total_results), page_size)
+            if len(entries) == page_size and starts:
+                with closing(self._fetch_pages(params, starts)) as pages:
+                    for results in pages:
+                        entries = results.get("entry")
+                        if not entries:
+                            break
+                        page = self.parse_results(entries)
+                        fetched_count += len(page)
+                        yield page
+
+            logger.info(f"Total papers fetched from Scopus: {fetched_count}")
 
         except requests.RequestException as e:
             logger.error(f"Error fetching from Scopus API: {e}")
-            return all_papers
+        except ValueError as e:
+            # orjson and json decode errors, e.g. an HTML error page
+            logger.error(f"Invalid JSON in Scopus API response: {e}")
+
+    def _fetch_pages(
+        self, params: Dict[str, Any], starts: Iterable[int]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch pages concurrently, yielding their results in order.
+
+        At most MAX_CONCURRENT_REQUESTS pages are in flight at once, and each
+        worker thread uses its own session, as requests sessions are not
+        guaranteed to be thread safe. Pages not yet started are cancelled when
+        the caller stops iterating or a request fails.
+        """
+        local = threading.local()
+        sessions: List[requests.Session] = []
+
+        def fetch(start: int) -> Dict[str, Any]:
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+                sessions.append(session)
+            return self._fetch_page(session, params, start)
+
+        starts = iter(starts)
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        try:
+            pending = deque(
+                executor.submit(fetch, start)
+                for start in islice(starts, MAX_CONCURRENT_REQUESTS)
+            )
+            while pending:
+                results = pending.popleft().result()
+                # Keep the window full while this page is being parsed
+                for start in islice(starts, 1):
+                    pending.append(executor.submit(fetch, start))
+                yield results
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for session in sessions:
+                session.close()
+
+    def _fetch_page(
+        self, session: requests.Session, params: Dict[str, Any], start: int
+    ) -> Dict[str, Any]:
+        """Fetch a single page of search results starting at an offset."""
+        logger.info(f"Fetching results {start + 1}-{start + params['count']}...")
+        response = session.get(
+            self.api_url,
+            headers=self.headers,
+            params={**params, "start": start},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        # Decode the raw body with the fastest available JSON parser
+        return loads(response.content).get("search-results", {})
 
     def parse_results(self, entries: List[Dict[str, Any]]) -> List[Paper]:
         """Parse Scopus API results into Paper objects."""
@@ -2,10 +2,12 @@
 
 import click
 
+from literator.utils import get_timestamp
 from literator.utils.logging import setup_logging
-from literator.core import fetch_papers, query_database
-from literator.display import display_stats
-from literator.db import init_db
+
+# The core, display and db modules pull in the API clients, the database
+# engine and most of rich, so they are imported inside the commands that use
+# them to keep startup (and --help) fast.
 
 
 @click.group()
@@ -48,6 +50,10 @@ def fetch_scopus_command(
     no_json: bool,
 ):
     """Fetch papers from Scopus API"""
+    from literator.core import fetch_papers
+
+    # Take the timestamp once so every output of this request shares it
+    timestamp = get_timestamp()
     fetch_papers(
         client_name="scopus",
         query=query,
@@ -56,6 +62,7 @@ def fetch_scopus_command(
         max_results=max_results,
         save_to_db=not no_db,
         save_to_json=not no_json,
+        timestamp=timestamp,
     )
 
 
@@ -66,7 +73,9 @@ def fetch_scopus_command(
 @click.option("--count", type=int, default=10, help="Number of papers to display")
 def fetch_results_command(file: str, count: int):
     """View results from a recent Scopus API call"""
-    # display_results(file, count)
+    from literator.display import display_request_results
+
+    display_request_results(file, count)
 
 
 # Papers command group
@@ -80,11 +89,17 @@ def papers_cli(ctx):
 @papers_cli.command("init_db")
 def init_command():
     """Initialize the database"""
+    from literator.db import init_db
+
     init_db()
 
 
 @papers_cli.command("query")
-@click.option("--query", help="Search term for titles, abstracts, or keywords")
+@click.option(
+    "--query",
+    help="Search term for titles or abstracts. Matches whole words, the last "
+    "of which may be a prefix, or any substring if SQLite lacks FTS5",
+)
 @click.option("--source", help="Filter by source (e.g., scopus, arxiv)")
 @click.option("--start-year", type=int, help="Start year for filtering results")
 @click.option("--end-year", type=int, help="End year for filtering results")
@@ -92,19 +107,33 @@ def init_command():
 @click.option("--print-results", is_flag=True, help="Print results to console")
 def query_command(query, source, start_year, end_year, limit, print_results):
     """Query the database for papers"""
-    query_database(
-        query=query,
-        source=source,
-        start_year=start_year,
-        end_year=end_year,
-        limit=limit,
-        print_results=print_results,
-    )
+    from literator.core import display_database_query, query_database
+
+    if print_results:
+        # Display only, so skip building full Paper objects
+        display_database_query(
+            query=query,
+            source=source,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+        )
+    else:
+        query_database(
+            query=query,
+            source=source,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+            print_results=False,
+        )
 
 
 @papers_cli.command("stats")
 def stats_command():
     """Display database statistics"""
+    from literator.display import display_stats
+
     display_stats()
 
 
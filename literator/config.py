@@ -1,10 +1,11 @@
 import os
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import appdirs
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from literator.utils import get_logger
 
@@ -43,8 +44,7 @@ class PathConfig(BaseModel):
     requests_dir: Path
     papers_dir: Path
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class DBConfig(BaseModel):
@@ -56,8 +56,7 @@ class DBConfig(BaseModel):
     pool_size: int = Field(5, gt=0, description="Connection pool size")
     max_overflow: int = Field(10, ge=0, description="Maximum overflow connections")
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class Config:
@@ -129,17 +128,20 @@ class Config:
         connect_timeout = int(self.env_vars.get("CONNECT_TIMEOUT", "10"))
         user_agent = self.env_vars.get("USER_AGENT", "Literator/1.0")
         rate_limit_pause = float(self.env_vars.get("RATE_LIMIT_PAUSE", "1.0"))
-        logger.debug(f"{scopus_api_key=}, type={type(scopus_api_key)}")
-        logger.debug(f"{scopus_api_url=}, type={type(scopus_api_url)}")
-        logger.debug(f"{request_timeout=}, type={type(request_timeout)}")
-        logger.debug(
-            f"{max_results_per_request=}, type={type(max_results_per_request)}"
-        )
-        logger.debug(f"{retry_count=}, type={type(retry_count)}")
-        logger.debug(f"{retry_backoff=}, type={type(retry_backoff)}")
-        logger.debug(f"{connect_timeout=}, type={type(connect_timeout)}")
-        logger.debug(f"{user_agent=}, type={type(user_agent)}")
-        logger.debug(f"{rate_limit_pause=}, type={type(rate_limit_pause)}")
+        # Pass values as arguments so nothing is formatted unless debug
+        # records are actually emitted
+        for name, value in (
+            ("scopus_api_key", scopus_api_key),
+            ("scopus_api_url", scopus_api_url),
+            ("request_timeout", request_timeout),
+            ("max_results_per_request", max_results_per_request),
+            ("retry_count", retry_count),
+            ("retry_backoff", retry_backoff),
+            ("connect_timeout", connect_timeout),
+            ("user_agent", user_agent),
+            ("rate_limit_pause", rate_limit_pause),
+        ):
+            logger.debug("%s=%r, type=%s", name, value, type(value))
 
         self.scopus = APIConfig(
             api_key=scopus_api_key,
@@ -152,6 +154,11 @@ class Config:
             user_agent=user_agent,
             rate_limit_pause=rate_limit_pause,
         )
+        # Settings don't change after start up, so dump them once for clients.
+        # Every client shares the result, so it is read-only at both levels.
+        self._api_config = MappingProxyType(
+            {"scopus": MappingProxyType(self.scopus.model_dump())}
+        )
         logger.debug("API settings initialized")
 
     def initialize_db_settings(self) -> None:
@@ -184,10 +191,10 @@ class Config:
         )
         logger.debug("Database settings initialized")
 
-    def get_api_config(self) -> dict[str, Any]:
-        """Return API configuration as a dictionary"""
+    def get_api_config(self) -> Mapping[str, Mapping[str, Any]]:
+        """Return API configuration as a read-only mapping"""
         logger.debug("Retrieving API configuration")
-        return {"scopus": self.scopus.model_dump()}
+        return self._api_config
 
     def get_db_config(self) -> dict[str, Any]:
         """Return database configuration as a dictionary"""
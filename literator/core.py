@@ -1,25 +1,100 @@
 """Core functionality for the litreview tool."""
 
-import json
-from typing import List, Literal, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Optional
 
+from pydantic import BaseModel
+
+from literator.utils import get_timestamp
 from literator.utils.logging import get_logger
+from literator.utils.serialization import dumps, loads
 from rich.console import Console
 
 from literator.api import APIClient, get_api_client
 from literator.config import REQUESTS_DIR
 from literator.db import (
+    SessionLocal,
+    count_papers,
+    db_session,
+    get_paper_count,
+    get_paper_summaries,
+    get_paper_uuids,
     get_papers_from_db,
     init_db,
-    save_papers_to_db,
+    save_papers_to_db_bulk,
 )
-from literator.db import Paper
+from literator.db import Paper, PaperSummary
 
 # Get logger
 logger = get_logger(__name__)
 console = Console()
 
 
+# Result sets larger than this are streamed to disk in chunks of papers
+JSON_STREAM_THRESHOLD = 1000
+JSON_STREAM_CHUNK_SIZE = 500
+
+
+def _iter_paper_dicts(papers: List[Paper]) -> Iterator[Dict[str, Any]]:
+    """Yield papers as JSON-ready dictionaries, skipping any that fail."""
+    # Handle both Pydantic models and dataclasses, deciding once per list.
+    # JSON mode already renders dates as ISO strings.
+    if papers and isinstance(papers[0], BaseModel):
+        to_dict = partial(type(papers[0]).model_dump, mode="json")
+    else:
+        to_dict = asdict
+
+    for paper in papers:
+        try:
+            yield to_dict(paper)
+        except Exception as e:
+            logger.error(f"Error processing paper for JSON: {str(e)}")
+
+
+def _encode_papers(papers: List[Paper]) -> List[bytes]:
+    """Encode each paper as a compact JSON object, once for every output."""
+    if papers and isinstance(papers[0], Paper):
+        # Skip the intermediate dictionaries for Pydantic papers
+        return Paper.dump_each(papers)
+    return [dumps(paper_dict) for paper_dict in _iter_paper_dicts(papers)]
+
+
+def _tmp_path(path: Path) -> Path:
+    """Get the temporary path a file is written to before being moved."""
+    return path.with_name(f"{path.name}.tmp")
+
+
+def _write_json_stream(
+    output_path: Path, results_dict: Dict[str, Any], items: List[bytes]
+) -> None:
+    """Write the results envelope and encoded papers compactly, in chunks."""
+    with open(output_path, "wb") as f:
+        # Open the envelope (without its closing brace) and the papers array
+        f.write(dumps(results_dict)[:-1])
+        f.write(b',"papers":[')
+        for start in range(0, len(items), JSON_STREAM_CHUNK_SIZE):
+            if start:
+                f.write(b",")
+            f.write(b",".join(items[start : start + JSON_STREAM_CHUNK_SIZE]))
+        f.write(b'],"count":%d}' % len(items))
+
+
+def _write_ndjson_sidecar(
+    output_path: Path, results_dict: Dict[str, Any], items: List[bytes]
+) -> None:
+    """Write the envelope, then one paper per line, to a ``.ndjson`` sidecar."""
+    sidecar_path = output_path.with_suffix(".ndjson")
+    tmp_path = _tmp_path(sidecar_path)
+    with open(tmp_path, "wb") as f:
+        f.write(dumps({**results_dict, "count": len(items)}) + b"\n")
+        f.writelines(item + b"\n" for item in items)
+    os.replace(tmp_path, sidecar_path)
+
+
 def save_json(
     papers: List[Paper],
     query: str,
@@ -27,33 +102,23 @@ def save_json(
     source: Literal["scopus"],
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
+    stream: Optional[bool] = None,
 ):
-    """Save papers to a JSON file."""
-    # Convert Pydantic models to dictionaries
-    papers_dict = []
-    for paper in papers:
-        try:
-            # Handle both Pydantic models and dataclasses
-            if hasattr(paper, "dict"):
-                paper_dict = paper.model_dump()
-            else:
-                from dataclasses import asdict
-
-                paper_dict = asdict(paper)
-
-            # Convert datetime to string for JSON serialization
-            if paper_dict.get("publication_date"):
-                paper_dict["publication_date"] = paper_dict[
-                    "publication_date"
-                ].strftime("%Y-%m-%d")
-            papers_dict.append(paper_dict)
-        except Exception as e:
-            logger.error(f"Error processing paper for JSON: {str(e)}")
+    """
+    Save papers to a JSON file.
+
+    Each paper is encoded once and the encoding is shared by both files.
+    Small result sets are written as a single indented document. Large ones
+    (or any when ``stream`` is True) are written compactly in chunks, so the
+    papers are never all held in memory as dictionaries.
 
+    Files are written under a temporary name and then renamed into place.
+    A compact ``.ndjson`` sidecar with the envelope on its first line and one
+    paper per following line is written next to the file, so viewers can
+    read just the first few papers.
+    """
     # Construct outer dictionary
     results_dict = {
-        "papers": papers_dict,
-        "count": len(papers_dict),
         "query": query,
         "timestamp": timestamp,
         "start_year": start_year,
@@ -67,10 +132,82 @@ def save_json(
     # Create directory if it doesn't exist
     output_path.parent.mkdir(exist_ok=True, parents=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results_dict, f, ensure_ascii=False, indent=4)
+    if stream is None:
+        stream = len(papers) > JSON_STREAM_THRESHOLD
+
+    # Both files are written from the same encoded papers
+    items = _encode_papers(papers)
+    count = len(items)
+
+    # Write to a temporary file and move it into place, so readers never see
+    # a partially written file
+    tmp_path = _tmp_path(output_path)
+    if stream:
+        _write_json_stream(tmp_path, results_dict, items)
+    else:
+        # Decode the encoded papers as plain data, so the whole document is
+        # indented the same way whichever JSON backend is installed
+        papers_data = loads(b"[" + b",".join(items) + b"]")
+        document = {**results_dict, "papers": papers_data, "count": count}
+        tmp_path.write_bytes(dumps(document, indent=True))
+    os.replace(tmp_path, output_path)
+    logger.info(f"Saved {count} papers to {output_path}")
+
+    # The main file is already in place, so report a sidecar failure on its
+    # own rather than as a failed save
+    try:
+        _write_ndjson_sidecar(output_path, results_dict, items)
+    except Exception as e:
+        logger.error(
+            f"Error writing NDJSON sidecar for {output_path}, "
+            f"the JSON file itself was saved: {str(e)}"
+        )
 
-    logger.info(f"Saved {len(papers)} papers to {output_path}")
+
+def _save_papers_to_db(papers: List[Paper]) -> None:
+    """Save fetched papers to the database, logging any failure."""
+    try:
+        # Initialize, save and count within a single transaction
+        with db_session() as session:
+            init_db(session)  # Ensure database is initialized
+            added_count = save_papers_to_db_bulk(papers, session)
+            total_papers = get_paper_count(session)
+        logger.info(f"Added {added_count} new papers to the database")
+        logger.info(f"Database now contains {total_papers} papers")
+    except Exception as e:
+        logger.error(f"Error saving to database: {str(e)}")
+
+
+def _use_stored_uuids(papers: List[Paper]) -> None:
+    """
+    Give papers that were already in the database their stored UUIDs,
+    updating the back-references held by their authors to match.
+    """
+    try:
+        stored = get_paper_uuids(list({paper.doi for paper in papers if paper.doi}))
+    except Exception as e:
+        logger.error(f"Error looking up stored paper UUIDs: {str(e)}")
+        return
+
+    for paper in papers:
+        stored_uuid = stored.get(paper.doi)
+        if stored_uuid is None or stored_uuid == paper.uuid:
+            continue
+        for author in paper.authors:
+            author.paper_uuids = [
+                stored_uuid if paper_uuid == paper.uuid else paper_uuid
+                for paper_uuid in author.paper_uuids
+            ]
+        paper.uuid = stored_uuid
+
+
+def _save_papers_to_json(*args, **kwargs) -> None:
+    """Save fetched papers to a JSON file, logging any failure."""
+    try:
+        save_json(*args, **kwargs)
+        logger.info("Saved results to JSON file")
+    except Exception as e:
+        logger.error(f"Error saving to JSON: {str(e)}")
 
 
 def fetch_papers(
@@ -81,6 +218,7 @@ def fetch_papers(
     max_results: int = 100,
     save_to_db: bool = True,
     save_to_json: bool = True,
+    timestamp: Optional[str] = None,
 ) -> List[Paper]:
     """
     Fetch papers from Scopus API.
@@ -93,6 +231,7 @@ def fetch_papers(
         max_results: Maximum number of results to fetch
         save_to_db: Whether to save results to the database
         save_to_json: Whether to save results to JSON file
+        timestamp: Timestamp for the request. If None, the current time is used
 
     Returns:
         List of Paper objects
@@ -104,45 +243,39 @@ def fetch_papers(
     client: APIClient = get_api_client(client_name)
     logger.info(f"Using {client_name} API client")
 
-    # Get timestamp
-    timestamp = get_timestamp()
+    # Get timestamp, unless the caller already took one
+    if timestamp is None:
+        timestamp = get_timestamp()
     logger.info(f"Timestamp: {timestamp}")
 
     # Initialize Scopus client
     try:
-        # Search Scopus
-        papers = client.search(
-            query=query,
-            start_year=start_year,
-            end_year=end_year,
-            max_results=max_results,
-        )
-
+        papers: List[Paper] = []
+
+        # Save each page to the database as soon as it arrives, on a single
+        # writer thread, so the saves overlap with fetching later pages
+        with ThreadPoolExecutor(max_workers=1) as db_executor:
+            for page in client.search_pages(
+                query=query,
+                start_year=start_year,
+                end_year=end_year,
+                max_results=max_results,
+            ):
+                papers.extend(page)
+                if save_to_db and page:
+                    db_executor.submit(_save_papers_to_db, page)
+
+        # Leaving the block waits for every save. Papers that were already
+        # stored, or repeated across pages, then take the database's UUIDs
+        # before anything else sees them
         logger.info(f"Found {len(papers)} papers")
-
-        # Save results to database if requested
         if save_to_db:
-            try:
-                init_db()  # Ensure database is initialized
-                added_count = save_papers_to_db(papers)
-                logger.info(f"Added {added_count} new papers to the database")
-            except Exception as e:
-                logger.error(f"Error saving to database: {str(e)}")
-
-        # Save results to JSON if output file is specified
+            _use_stored_uuids(papers)
+
         if save_to_json:
-            try:
-                save_json(
-                    papers,
-                    query,
-                    timestamp,
-                    client.name,
-                    start_year,
-                    end_year,
-                )
-                logger.info("Saved results to JSON file")
-            except Exception as e:
-                logger.error(f"Error saving to JSON: {str(e)}")
+            _save_papers_to_json(
+                papers, query, timestamp, client.name, start_year, end_year
+            )
 
         return papers
 
@@ -180,10 +313,50 @@ def query_database(
         if print_results:
             from literator.display import display_query_results
 
-            display_query_results(papers)
+            display_query_results([PaperSummary.from_paper(p) for p in papers])
 
         return papers
 
     except Exception as e:
         logger.error(f"Error querying database: {str(e)}")
         return []
+
+
+def display_database_query(
+    query: Optional[str] = None,
+    source: Optional[Literal["scopus"]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    limit: int = 100,
+    display_limit: int = 10,
+) -> None:
+    """
+    Query the database and print the results, without building Paper objects.
+
+    Only the rows that are shown are fetched; the rest are counted in SQL.
+
+    Args:
+        query: Search term for titles, abstracts, or keywords
+        source: Filter by source (e.g., scopus, arxiv)
+        start_year: Start year for filtering results
+        end_year: End year for filtering results
+        limit: Maximum number of results to return
+        display_limit: Maximum number of results to print
+    """
+    try:
+        init_db()  # Ensure database is initialized
+        with SessionLocal() as session:
+            summaries = get_paper_summaries(
+                query, source, start_year, end_year, min(limit, display_limit), session
+            )
+            total = min(
+                limit, count_papers(query, source, start_year, end_year, session)
+            )
+        logger.info(f"Found {total} papers in database")
+
+        from literator.display import display_query_results
+
+        display_query_results(summaries, total=total, limit=display_limit)
+
+    except Exception as e:
+        logger.error(f"Error querying database: {str(e)}")
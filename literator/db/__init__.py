@@ -9,21 +9,38 @@ Models:
     Author: Represents an author of academic papers
     Keyword: Represents keywords associated with papers
     PaperAuthorLink: Represents the many-to-many relationship between papers and authors
+    PaperSummary: Lightweight paper row used for display
 
 Functions:
+    SessionLocal: Create a session whose objects stay loaded after commit
+    db_session: Run database work in a single transaction
     init_db: Initialize the database schema
     save_papers_to_db: Save paper records to the database
+    save_papers_to_db_bulk: Save paper records with bulk inserts
+    get_paper_uuids: Look up the stored UUIDs of papers by DOI
+    get_paper_count: Count the papers stored in the database
+    count_papers: Count the papers matching query filters
     get_stats: Retrieve statistics about the database contents
     get_papers_from_db: Query and retrieve papers from the database
+    iter_papers_from_db: Stream papers from the database in batches
+    get_paper_summaries: Query lightweight paper rows for display
 """
 
 # Expose module
-from literator.db.models import Paper, Author, Keyword, PaperAuthorLink
+from literator.db.models import Paper, Author, Keyword, PaperAuthorLink, PaperSummary
 from literator.db.handler import (
+    SessionLocal,
+    db_session,
     init_db,
     save_papers_to_db,
+    save_papers_to_db_bulk,
+    get_paper_uuids,
+    get_paper_count,
+    count_papers,
     get_stats,
     get_papers_from_db,
+    iter_papers_from_db,
+    get_paper_summaries,
 )
 
 __all__ = [
@@ -31,8 +48,17 @@ __all__ = [
     "Author",
     "Keyword",
     "PaperAuthorLink",
+    "PaperSummary",
+    "SessionLocal",
+    "db_session",
     "init_db",
     "save_papers_to_db",
+    "save_papers_to_db_bulk",
+    "get_paper_uuids",
+    "get_paper_count",
+    "count_papers",
     "get_stats",
     "get_papers_from_db",
+    "iter_papers_from_db",
+    "get_paper_summaries",
 ]
@@ -1,12 +1,34 @@
 import logging
-from typing import List, Optional, Dict, Any
-
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func as sqlalchemy_func
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Any
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import selectinload, sessionmaker
+from sqlalchemy import (
+    Connection,
+    bindparam,
+    column,
+    event,
+    func as sqlalchemy_func,
+    insert,
+    inspect,
+    table,
+    text,
+    update,
+)
 from sqlmodel import Session, SQLModel, create_engine, select, or_, col
 from rich.console import Console
 
-from literator.db.models import Paper, PaperDB, AuthorDB, Keyword, PaperAuthorLink
+from literator.db.models import (
+    Paper,
+    PaperDB,
+    PaperSummary,
+    AuthorDB,
+    Keyword,
+    PaperAuthorLink,
+)
 from literator.config import get_db_config
 from literator.utils import str_to_datetime
 
@@ -20,75 +42,296 @@ DB_URL = f"sqlite:///{config['path']}"
 DB_PATH = config["path"]
 
 # Create engine
-engine = create_engine(DB_URL, echo=config["echo"])
+engine = create_engine(DB_URL, echo=config["echo"], query_cache_size=1200)
+
+# Objects stay loaded after commit, so returning them doesn't cost a re-fetch
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+# Set once the schema has been created in this process
+_DB_READY = False
+
+# Number of DOIs looked up per IN (...) query when bulk saving papers
+DOI_LOOKUP_CHUNK_SIZE = 500
+
+# Existing paper lookups, built once and reused with a list of DOIs bound to
+# the expanding "dois" parameter, so repeated saves hit the compiled cache
+_DOI_PARAM = bindparam("dois", expanding=True)
+_PAPERS_BY_DOI = select(PaperDB).where(col(PaperDB.doi).in_(_DOI_PARAM))
+_PAPER_KEYS_BY_DOI = select(PaperDB.doi, PaperDB.uuid, PaperDB.citations).where(
+    col(PaperDB.doi).in_(_DOI_PARAM)
+)
+
+# Number of rows fetched per round trip when streaming query results
+STREAM_BATCH_SIZE = 500
+
+# Query results list the newest papers first, with undated papers last as
+# SQLite sorts NULL lowest, and ties broken by uuid so the order is stable
+_PAPER_ORDER = (col(PaperDB.publication_date).desc(), col(PaperDB.uuid))
+_AUTHOR_ORDER = (col(AuthorDB.position), col(AuthorDB.uuid))
+
+# Joins author names in GROUP_CONCAT; the unit separator won't be in a name
+_NAME_SEPARATOR = "\x1f"
+
+# Full-text index over paper titles and abstracts, kept in sync with paperdb
+# by triggers. None until checked, False if SQLite lacks FTS5. Rows are keyed
+# by paper uuid rather than rowid, which VACUUM may renumber on paperdb, so
+# the index keeps its own copy of the text. Deleting or retitling a paper
+# scans the index for its uuid, but papers are only ever inserted here.
+FTS_TABLE = "paperdb_search"
+_FTS_SETUP = (
+    # Replace the rowid keyed index used by earlier versions
+    "DROP TRIGGER IF EXISTS paperdb_fts_ai",
+    "DROP TRIGGER IF EXISTS paperdb_fts_ad",
+    "DROP TRIGGER IF EXISTS paperdb_fts_au",
+    "DROP TABLE IF EXISTS paperdb_fts",
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(uuid UNINDEXED, title, abstract)",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON paperdb BEGIN "
+    f"INSERT INTO {FTS_TABLE}(uuid, title, abstract) "
+    "VALUES (new.uuid, new.title, new.abstract); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON paperdb BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE uuid = old.uuid; END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au "
+    "AFTER UPDATE OF uuid, title, abstract ON paperdb BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE uuid = old.uuid; "
+    f"INSERT INTO {FTS_TABLE}(uuid, title, abstract) "
+    "VALUES (new.uuid, new.title, new.abstract); END",
+    # Index the papers saved before the table existed
+    f"INSERT INTO {FTS_TABLE}(uuid, title, abstract) "
+    "SELECT uuid, title, abstract FROM paperdb",
+)
+_FTS_READY: Optional[bool] = None
+
+# Number authors saved before AuthorDB.position existed in the order they
+# were inserted, which is the order they were listed on the paper
+_AUTHOR_POSITION_BACKFILL = (
+    "UPDATE authordb SET position = ("
+    "SELECT COUNT(*) FROM authordb AS earlier "
+    "WHERE earlier.paper_id = authordb.paper_id AND earlier.rowid < authordb.rowid"
+    ") WHERE position IS NULL"
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Use write-ahead logging so commits avoid a full journal sync, wait on
+    locks instead of failing immediately, keep temporary tables in memory,
+    and read through a 256 MB memory map and a 64 MB page cache
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+@contextmanager
+def db_session() -> Iterator[Session]:
+    """
+    Open a session whose work is committed as a single transaction on exit,
+    or rolled back if an exception is raised.
+    """
+    with SessionLocal() as session:
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
 
 
-def init_db():
-    """Initialize the database by creating all tables"""
+def init_db(session: Optional[Session] = None):
+    """
+    Initialize the database by creating all tables, once per process.
+
+    If a session is given, the schema is created in its transaction and the
+    database is only marked as initialized once that transaction commits, so
+    a rollback leaves the next call to create it again. Functions that open
+    their own session call this first, so a database made by an older
+    version is brought up to date before it is read.
+    """
+    if _DB_READY:
+        return
+
     logger.info(f"Initializing database at {DB_PATH}")
 
     # Ensure the directory exists
     DB_PATH.parent.mkdir(exist_ok=True, parents=True)
-    SQLModel.metadata.create_all(engine)
+    if session is not None:
+        fts_ready = _create_schema(session.connection())
+        event.listen(
+            session, "after_commit", lambda _: _mark_db_ready(fts_ready), once=True
+        )
+    else:
+        with engine.begin() as connection:
+            fts_ready = _create_schema(connection)
+        _mark_db_ready(fts_ready)
+
     logger.info("Database initialized")
 
 
-def save_papers_to_db(papers: List[Paper]) -> int:
+def _mark_db_ready(fts_ready: bool):
+    """Record that the schema has been committed, and if FTS5 is available"""
+    global _DB_READY, _FTS_READY
+    _DB_READY = True
+    _FTS_READY = fts_ready
+
+
+def _create_schema(connection: Connection) -> bool:
     """
-    Save papers to the database, skipping duplicates based on DOI.
+    Create missing tables, columns, indexes and the full-text index.
 
     Returns:
-        Number of new papers added to the database.
+        Whether the full-text index is available
     """
-    added_count = 0
-    skipped_count = 0
+    SQLModel.metadata.create_all(connection)
+
+    # create_all skips existing tables, so bring tables from a database made
+    # before later columns or indexes were declared up to date. New columns
+    # must be nullable for ALTER TABLE to add them.
+    inspector = inspect(connection)
+    added = set()
+    for sql_table in SQLModel.metadata.sorted_tables:
+        existing = {info["name"] for info in inspector.get_columns(sql_table.name)}
+        for db_column in sql_table.columns:
+            if db_column.name not in existing:
+                column_type = db_column.type.compile(connection.dialect)
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {sql_table.name} "
+                        f"ADD COLUMN {db_column.name} {column_type}"
+                    )
+                )
+                added.add(f"{sql_table.name}.{db_column.name}")
+                logger.info(f"Added column {sql_table.name}.{db_column.name}")
 
-    with Session(engine) as session:
-        for paper in papers:
-            # Skip papers without DOI as we can't reliably check for duplicates
-            if not paper.doi:
-                skipped_count += 1
-                continue
+        for index in sql_table.indexes:
+            index.create(connection, checkfirst=True)
 
-            # Check if the paper already exists by DOI
-            existing_paper = session.exec(
-                select(PaperDB).where(PaperDB.doi == paper.doi)
-            ).first()
+    if "authordb.position" in added:
+        connection.execute(text(_AUTHOR_POSITION_BACKFILL))
 
-            if existing_paper:
-                # Update citation count if necessary
-                if paper.citations and (
-                    not existing_paper.citations
-                    or paper.citations > existing_paper.citations
-                ):
-                    existing_paper.citations = paper.citations
-                    session.add(existing_paper)
+    return _create_fts(connection)
 
-                # Store the existing UUID for potential reference
-                paper.uuid = existing_paper.uuid
 
-                skipped_count += 1
-                continue
+def _fts_exists(connection: Connection) -> bool:
+    """Check whether the full-text index table has been created"""
+    statement = text("SELECT 1 FROM sqlite_master WHERE name = :name")
+    return connection.execute(statement, {"name": FTS_TABLE}).first() is not None
 
-            # Convert to database model and add
-            paper_db = PaperDB.from_paper(paper)
 
-            try:
-                session.add(paper_db)
+def _create_fts(connection: Connection) -> bool:
+    """
+    Create the full-text index and its sync triggers if missing.
+
+    Returns:
+        Whether the full-text index is available
+    """
+    if _fts_exists(connection):
+        return True
+
+    try:
+        for statement in _FTS_SETUP:
+            connection.execute(text(statement))
+    except OperationalError as e:
+        logger.warning(f"Full-text search unavailable, using LIKE instead: {e}")
+        return False
+    return True
+
+
+def _fts_available() -> bool:
+    """Whether title/abstract searches can use the full-text index"""
+    global _FTS_READY
+    if _FTS_READY is None:
+        with engine.connect() as connection:
+            _FTS_READY = _fts_exists(connection)
+    return _FTS_READY
 
-                # Save paper-author links
-                for author in paper.authors:
-                    # Create paper-author link
-                    link = PaperAuthorLink(
-                        paper_uuid=paper.uuid, author_uuid=author.uuid
-                    )
-                    session.add(link)
 
-                session.commit()
+def save_papers_to_db(papers: List[Paper], session: Optional[Session] = None) -> int:
+    """
+    Save papers to the database, skipping duplicates based on DOI.
+
+    Existing papers are looked up by DOI up front and all new papers are
+    added in one flush, retrying paper by paper only if that fails. All papers
+    are written in one transaction. If a session is given, the caller's
+    transaction is used and committing is left to the caller.
+
+    Returns:
+        Number of new papers added to the database.
+    """
+    if session is None:
+        with db_session() as session:
+            return save_papers_to_db(papers, session)
+
+    added_count = 0
+    skipped_count = 0
+
+    # Look up the papers that already exist, a chunk of DOIs per query
+    dois = list({paper.doi for paper in papers if paper.doi})
+    existing: Dict[str, PaperDB] = {}
+    for start in range(0, len(dois), DOI_LOOKUP_CHUNK_SIZE):
+        rows = session.exec(
+            _PAPERS_BY_DOI,
+            params={"dois": dois[start : start + DOI_LOOKUP_CHUNK_SIZE]},
+        )
+        existing.update((row.doi, row) for row in rows)
+
+    new_rows = []
+    for paper in papers:
+        # Skip papers without DOI as we can't reliably check for duplicates
+        if not paper.doi:
+            skipped_count += 1
+            continue
+
+        existing_paper = existing.get(paper.doi)
+        if existing_paper:
+            # Update citation count if necessary
+            if paper.citations and (
+                not existing_paper.citations
+                or paper.citations > existing_paper.citations
+            ):
+                existing_paper.citations = paper.citations
+                session.add(existing_paper)
+
+            # Store the existing UUID for potential reference
+            paper.uuid = existing_paper.uuid
+
+            skipped_count += 1
+            continue
+
+        # Convert to database model, with its paper-author links
+        paper_db = PaperDB.from_paper(paper)
+        links = [
+            PaperAuthorLink(paper_uuid=paper.uuid, author_uuid=author.uuid)
+            for author in paper.authors
+        ]
+        new_rows.append((paper, paper_db, links))
+
+        # Later papers with the same DOI refer to this one
+        existing[paper.doi] = paper_db
+
+    try:
+        # Add every new paper at once, in a savepoint so a failure can be
+        # retried paper by paper below
+        with session.begin_nested():
+            for _, paper_db, links in new_rows:
+                session.add(paper_db)
+                session.add_all(links)
+        added_count = len(new_rows)
+    except IntegrityError:
+        for paper, paper_db, links in new_rows:
+            try:
+                # Use a savepoint so a failing paper doesn't undo the others
+                with session.begin_nested():
+                    session.add(paper_db)
+                    session.add_all(links)
                 added_count += 1
             except IntegrityError:
                 logger.warning(f"Issue adding paper: {paper.title}. Skipping...")
-                session.rollback()
                 skipped_count += 1
 
     logger.info(
@@ -97,15 +340,219 @@ def save_papers_to_db(papers: List[Paper]) -> int:
     return added_count
 
 
-def get_papers_from_db(
+def save_papers_to_db_bulk(
+    papers: List[Paper], session: Optional[Session] = None
+) -> int:
+    """
+    Save papers to the database with one executemany INSERT per table,
+    skipping duplicates based on DOI.
+
+    Existing papers are looked up in a single query and have their citation
+    counts updated as in save_papers_to_db. Rows are inserted with Core
+    statements, bypassing the ORM unit of work, all in one transaction. If a
+    session is given, the caller's transaction is used and committing is
+    left to the caller.
+
+    The given papers are not modified; use get_paper_uuids to find the UUIDs
+    stored for papers that were already in the database.
+
+    Returns:
+        Number of new papers added to the database.
+    """
+    if session is None:
+        with db_session() as session:
+            return save_papers_to_db_bulk(papers, session)
+
+    # Papers without a DOI can't be reliably checked for duplicates, and only
+    # the first paper is kept for a DOI repeated within the batch
+    by_doi: Dict[str, Paper] = {}
+    for paper in papers:
+        if paper.doi:
+            by_doi.setdefault(paper.doi, paper)
+
+    # Look up the papers that already exist, a chunk of DOIs per query to
+    # stay well under SQLite's bound parameter limit
+    existing = {}
+    dois = list(by_doi)
+    for start in range(0, len(dois), DOI_LOOKUP_CHUNK_SIZE):
+        existing_rows = session.exec(
+            _PAPER_KEYS_BY_DOI,
+            params={"dois": dois[start : start + DOI_LOOKUP_CHUNK_SIZE]},
+        )
+        existing.update(
+            (doi, (uuid_, citations)) for doi, uuid_, citations in existing_rows
+        )
+
+    new_papers = []
+    citation_updates = []
+    for doi, paper in by_doi.items():
+        if doi not in existing:
+            new_papers.append(paper)
+            continue
+
+        # Update citation count if necessary
+        stored_uuid, citations = existing[doi]
+        if paper.citations and (not citations or paper.citations > citations):
+            citation_updates.append(
+                {"b_uuid": stored_uuid, "b_citations": paper.citations}
+            )
+
+    if citation_updates:
+        session.execute(
+            update(PaperDB.__table__)
+            .where(PaperDB.__table__.c.uuid == bindparam("b_uuid"))
+            .values(citations=bindparam("b_citations")),
+            citation_updates,
+        )
+
+    added_count = 0
+    if new_papers:
+        paper_rows = [PaperDB.row_from_paper(paper) for paper in new_papers]
+        author_rows = [
+            {
+                "uuid": author.uuid,
+                "name": author.name,
+                "affiliation": author.affiliation,
+                "orcid": author.orcid,
+                "paper_id": paper.uuid,
+                "position": position,
+            }
+            for paper in new_papers
+            for position, author in enumerate(paper.authors)
+        ]
+        keyword_rows = [
+            {"uuid": str(uuid.uuid4()), "keyword": keyword, "paper_id": paper.uuid}
+            for paper in new_papers
+            for keyword in paper.keywords
+        ]
+        link_rows = [
+            {"paper_uuid": paper.uuid, "author_uuid": author.uuid}
+            for paper in new_papers
+            for author in paper.authors
+        ]
+
+        result = session.execute(
+            insert(PaperDB.__table__).prefix_with("OR IGNORE"), paper_rows
+        )
+        added_count = result.rowcount
+        for model, rows in (
+            (AuthorDB, author_rows),
+            (Keyword, keyword_rows),
+            (PaperAuthorLink, link_rows),
+        ):
+            if rows:
+                session.execute(insert(model.__table__).prefix_with("OR IGNORE"), rows)
+
+    logger.info(
+        f"Added {added_count} new papers to the database. "
+        f"Skipped {len(papers) - added_count} papers..."
+    )
+    return added_count
+
+
+def get_paper_uuids(
+    dois: List[str], session: Optional[Session] = None
+) -> Dict[str, str]:
+    """
+    Look up the UUIDs stored for papers with the given DOIs.
+
+    Returns:
+        Mapping of DOI to stored UUID, for the DOIs found in the database
+    """
+    if session is None:
+        init_db()  # Bring older databases up to date
+        with SessionLocal() as session:
+            return get_paper_uuids(dois, session)
+
+    uuids = {}
+    for start in range(0, len(dois), DOI_LOOKUP_CHUNK_SIZE):
+        rows = session.exec(
+            _PAPER_KEYS_BY_DOI,
+            params={"dois": dois[start : start + DOI_LOOKUP_CHUNK_SIZE]},
+        )
+        uuids.update((doi, uuid_) for doi, uuid_, _ in rows)
+    return uuids
+
+
+def _filter_papers(
+    statement,
+    query: Optional[str] = None,
+    source: Optional[str] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+):
+    """
+    Apply the common paper search filters to a select statement.
+
+    If SQLite has FTS5, the query is matched against the full-text index as
+    a phrase of whole words, the last of which may be a prefix, so "neural
+    net" matches "neural networks" but "eural" matches nothing. Without FTS5
+    it falls back to a case-insensitive substring search, which would match
+    both.
+    """
+    # Apply filters
+    if source:
+        statement = statement.where(PaperDB.source == source)
+
+    # Papers without a publication date are kept by both year bounds
+    if start_year:
+        start_date = str_to_datetime(f"{start_year}-01-01", "%Y-%m-%d")
+        statement = statement.where(
+            or_(
+                col(PaperDB.publication_date).is_(None),
+                col(PaperDB.publication_date) >= start_date,
+            )
+        )
+
+    if end_year:
+        # Compare against the start of the next year so that papers dated
+        # during 31 December are still included
+        end_date = str_to_datetime(f"{end_year + 1}-01-01", "%Y-%m-%d")
+        statement = statement.where(
+            or_(
+                col(PaperDB.publication_date).is_(None),
+                col(PaperDB.publication_date) < end_date,
+            )
+        )
+
+    if query and _fts_available():
+        # Match the query as a phrase whose last word may be a prefix, quoted
+        # so that FTS5 operators in the user's text are taken literally
+        fts_query = '"{}"*'.format(query.replace('"', '""'))
+        fts_table = table(FTS_TABLE, column("uuid"))
+        matches = select(fts_table.c.uuid).where(
+            text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=fts_query)
+        )
+        statement = statement.where(col(PaperDB.uuid).in_(matches))
+    elif query:
+        # Case-insensitive substring search; unlike LIKE, instr() doesn't treat
+        # % and _ in the query as wildcards or run a pattern matcher per row
+        query_term = query.lower()
+        title = sqlalchemy_func.lower(PaperDB.title)
+        abstract = sqlalchemy_func.lower(PaperDB.abstract)
+        statement = statement.where(
+            or_(
+                sqlalchemy_func.instr(title, query_term) > 0,
+                sqlalchemy_func.instr(abstract, query_term) > 0,
+            )
+        )
+
+    return statement
+
+
+def iter_papers_from_db(
     query: Optional[str] = None,
     source: Optional[str] = None,
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
     limit: int = 100,
-) -> List[Paper]:
+    session: Optional[Session] = None,
+) -> Iterator[Paper]:
     """
-    Retrieve papers from the database with optional filtering.
+    Stream papers from the database with optional filtering, newest first.
+
+    Rows are fetched and converted in batches of STREAM_BATCH_SIZE, so only
+    one batch is held in memory at a time.
 
     Args:
         query: Text search in title, abstract, or keywords
@@ -113,103 +560,199 @@ def get_papers_from_db(
         start_year: Filter papers published after this year
         end_year: Filter papers published before this year
         limit: Maximum number of results
+        session: Session to query with, or None to open one
 
-    Returns:
-        List of Paper objects
+    Yields:
+        Paper objects
     """
-    with Session(engine) as session:
-        statement = select(PaperDB)
-
-        # Apply filters
-        if source:
-            statement = statement.where(PaperDB.source == source)
-
-        if start_year:
-            start_date = str_to_datetime(f"{start_year}-01-01", "%Y-%m-%d")
-            # Properly handle the date comparison
-            statement = statement.where(
-                or_(
-                    PaperDB.publication_date is None,  # Handle None values
-                    PaperDB.publication_date is not None
-                    and PaperDB.publication_date >= start_date,
-                )
+    if session is None:
+        init_db()  # Bring older databases up to date
+        with SessionLocal() as session:
+            yield from iter_papers_from_db(
+                query, source, start_year, end_year, limit, session
             )
+        return
 
-        if end_year:
-            end_date = str_to_datetime("{end_year}-12-31", "%Y-%m-%d")
-            # Properly handle the date comparison
-            statement = statement.where(
-                or_(
-                    PaperDB.publication_date is None,  # Handle None values
-                    PaperDB.publication_date is not None
-                    and PaperDB.publication_date >= end_date,
-                )
-            )
+    # Load authors and keywords for each batch in one query each
+    statement = select(PaperDB).options(
+        selectinload(PaperDB.authors), selectinload(PaperDB.keyword_objects)
+    )
+
+    statement = _filter_papers(statement, query, source, start_year, end_year)
+    statement = (
+        statement.order_by(*_PAPER_ORDER)
+        .limit(limit)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
 
-        if query:
-            query_term = f"%{query}%"
-            # Use SQLAlchemy's column expressions for LIKE operations
-            statement = statement.where(
-                or_(
-                    col(PaperDB.title).like(query_term),
-                    col(PaperDB.abstract).like(query_term),
+    for results in session.exec(statement).partitions():
+        # Get the author-paper links for the batch in a single query
+        author_uuids = defaultdict(list)
+        links = session.exec(
+            select(PaperAuthorLink.paper_uuid, PaperAuthorLink.author_uuid).where(
+                col(PaperAuthorLink.paper_uuid).in_(
+                    [result.uuid for result in results]
                 )
             )
-
-        statement = statement.limit(limit)
-        results = session.exec(statement).all()
+        )
+        for paper_uuid, author_uuid in links:
+            author_uuids[paper_uuid].append(author_uuid)
 
         # Convert to Paper objects
-        papers = []
         for result in results:
             paper = result.to_paper()
 
-            # Get all author-paper links for this paper
-            author_links = session.exec(
-                select(PaperAuthorLink).where(PaperAuthorLink.paper_uuid == paper.uuid)
-            ).all()
-
             # Update author_uuids
-            paper.author_uuids = [link.author_uuid for link in author_links]
+            paper.author_uuids = author_uuids[paper.uuid]
+
+            yield paper
+
+
+def get_papers_from_db(
+    query: Optional[str] = None,
+    source: Optional[str] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    limit: int = 100,
+    session: Optional[Session] = None,
+) -> List[Paper]:
+    """
+    Retrieve papers from the database with optional filtering, newest first.
+
+    Args:
+        query: Text search in title, abstract, or keywords
+        source: Filter by source (e.g., 'scopus', 'arxiv')
+        start_year: Filter papers published after this year
+        end_year: Filter papers published before this year
+        limit: Maximum number of results
+        session: Session to query with, or None to open one
+
+    Returns:
+        List of Paper objects
+    """
+    return list(
+        iter_papers_from_db(query, source, start_year, end_year, limit, session)
+    )
+
+
+def get_paper_summaries(
+    query: Optional[str] = None,
+    source: Optional[str] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    limit: int = 100,
+    session: Optional[Session] = None,
+) -> List[PaperSummary]:
+    """
+    Retrieve lightweight paper rows for display, selecting only the columns
+    that are shown and skipping Paper model construction.
+
+    Takes the same filters as get_papers_from_db.
+
+    Returns:
+        List of PaperSummary rows
+    """
+    if session is None:
+        init_db()  # Bring older databases up to date
+        with SessionLocal() as session:
+            return get_paper_summaries(
+                query, source, start_year, end_year, limit, session
+            )
+
+    # Let SQLite join each paper's author names into one column. GROUP_CONCAT
+    # has no defined order of its own, so it reads from a subquery ordered by
+    # position, which keeps the authors in the order listed on the paper.
+    ordered_names = (
+        select(AuthorDB.name)
+        .where(col(AuthorDB.paper_id) == PaperDB.uuid)
+        .order_by(*_AUTHOR_ORDER)
+        .correlate(PaperDB)
+        .subquery()
+    )
+    author_names = select(
+        sqlalchemy_func.group_concat(ordered_names.c.name, _NAME_SEPARATOR)
+    ).scalar_subquery()
+    statement = select(
+        PaperDB.title, PaperDB.publication_date, author_names, PaperDB.source
+    )
+    statement = _filter_papers(statement, query, source, start_year, end_year)
+    rows = session.exec(statement.order_by(*_PAPER_ORDER).limit(limit)).all()
+
+    return [
+        PaperSummary(
+            title,
+            publication_date,
+            names.split(_NAME_SEPARATOR) if names else [],
+            paper_source,
+        )
+        for title, publication_date, names, paper_source in rows
+    ]
+
+
+def count_papers(
+    query: Optional[str] = None,
+    source: Optional[str] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    session: Optional[Session] = None,
+) -> int:
+    """
+    Count the papers matching the same filters as get_papers_from_db.
 
-            papers.append(paper)
+    Returns:
+        Number of matching papers
+    """
+    if session is None:
+        init_db()  # Bring older databases up to date
+        with SessionLocal() as session:
+            return count_papers(query, source, start_year, end_year, session)
 
-    return papers
+    statement = select(sqlalchemy_func.count()).select_from(PaperDB)
+    statement = _filter_papers(statement, query, source, start_year, end_year)
+    return session.exec(statement).one()
 
 
-def get_paper_count() -> int:
+def get_paper_count(session: Optional[Session] = None) -> int:
     """Get the total number of papers in the database"""
-    with Session(engine) as session:
-        # Use proper counting with SQLModel
-        statement = select(sqlalchemy_func.count()).select_from(PaperDB)
-        return session.exec(statement).one()
+    if session is None:
+        init_db()  # Bring older databases up to date
+        with SessionLocal() as session:
+            return get_paper_count(session)
 
+    # Use proper counting with SQLModel
+    statement = select(sqlalchemy_func.count()).select_from(PaperDB)
+    return session.exec(statement).one()
 
-def get_stats() -> Dict[str, Any]:
+
+def get_stats(session: Optional[Session] = None) -> Dict[str, Any]:
     """Get statistics about the database"""
-    with Session(engine) as session:
-        # Get total papers using SQLAlchemy function
-        paper_count_stmt = select(sqlalchemy_func.count()).select_from(PaperDB)
-        total_papers = session.exec(paper_count_stmt).one()
-
-        # Get total authors using SQLAlchemy function
-        author_count_stmt = select(sqlalchemy_func.count()).select_from(AuthorDB)
-        total_authors = session.exec(author_count_stmt).one()
-
-        # Count papers by source
-        sources_query = select(PaperDB.source, sqlalchemy_func.count()).group_by(
-            PaperDB.source
-        )
-        sources = {source: count for source, count in session.exec(sources_query).all()}
-
-        # Get the 10 most common keywords
-        keywords_query = (
-            select(Keyword.keyword, sqlalchemy_func.count())
-            .group_by(Keyword.keyword)
-            .order_by(sqlalchemy_func.count().desc())
-            .limit(10)
-        )
-        top_keywords = {kw: count for kw, count in session.exec(keywords_query).all()}
+    if session is None:
+        init_db()  # Bring older databases up to date
+        with SessionLocal() as session:
+            return get_stats(session)
+
+    # Get total papers using SQLAlchemy function
+    paper_count_stmt = select(sqlalchemy_func.count()).select_from(PaperDB)
+    total_papers = session.exec(paper_count_stmt).one()
+
+    # Get total authors using SQLAlchemy function
+    author_count_stmt = select(sqlalchemy_func.count()).select_from(AuthorDB)
+    total_authors = session.exec(author_count_stmt).one()
+
+    # Count papers by source
+    sources_query = select(PaperDB.source, sqlalchemy_func.count()).group_by(
+        PaperDB.source
+    )
+    sources = {source: count for source, count in session.exec(sources_query).all()}
+
+    # Get the 10 most common keywords
+    keywords_query = (
+        select(Keyword.keyword, sqlalchemy_func.count())
+        .group_by(Keyword.keyword)
+        .order_by(sqlalchemy_func.count().desc())
+        .limit(10)
+    )
+    top_keywords = {kw: count for kw, count in session.exec(keywords_query).all()}
 
     return {
         "total_papers": total_papers,
@@ -1,10 +1,22 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, NamedTuple, Optional, Dict, Any, Union
 import uuid
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SkipValidation,
+    TypeAdapter,
+)
+from sqlalchemy import Index
 from sqlmodel import Field as SQLField, SQLModel, Relationship
 
+from literator.utils.logging import get_logger
+from literator.utils.serialization import compress, decompress, dumps, loads
+
+logger = get_logger(__name__)
+
 
 class Author(BaseModel):
     uuid: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -21,7 +33,9 @@ class AuthorDB(SQLModel, table=True):
     name: str
     affiliation: Optional[str] = None
     orcid: Optional[str] = None
-    paper_id: Optional[str] = SQLField(foreign_key="paperdb.uuid")
+    paper_id: Optional[str] = SQLField(foreign_key="paperdb.uuid", index=True)
+    # Place in the paper's author list, counting from 0
+    position: Optional[int] = None
     paper: Optional["PaperDB"] = Relationship(back_populates="authors")
 
 
@@ -52,48 +66,80 @@ class Paper(BaseModel):
     abstract: Optional[str] = None
     publication_date: Optional[datetime] = None
     journal: Optional[str] = None
-    doi: Optional[str] = None
+    # Checked by pydantic-core rather than a Python validator
+    doi: Optional[str] = Field(default=None, pattern=r"^10\.")
     url: Optional[str] = None
     citations: Optional[int] = None
     keywords: List[str] = Field(default_factory=list)
     keyword_uuids: List[str] = Field(default_factory=list)
     source: str = ""  # e.g., 'scopus', 'arxiv', etc.
     source_id: Optional[str] = None
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict
-    )  # For storing source-specific data
+    # Source-specific data, stored as given since it is opaque to us
+    metadata: SkipValidation[Dict[str, Any]] = Field(default_factory=dict)
 
-    class Config:
-        arbitrary_types_allowed = True
-
-    @field_validator("doi")
-    def doi_must_be_valid(cls, v):
-        """Simple validation for DOI format"""
-        if v is not None and not v.startswith("10."):
-            raise ValueError("DOI must start with 10.")
-        return v
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def __str__(self):
         return f"{self.title} ({len(self.authors)} authors, {self.publication_date})"
 
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "Paper":
+        """Parse and validate a paper from JSON in a single pass"""
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def list_from_json(cls, raw: Union[bytes, str]) -> List["Paper"]:
+        """Parse and validate a JSON array of papers in a single pass"""
+        return PAPER_LIST_ADAPTER.validate_json(raw)
+
+    @classmethod
+    def dump_many(cls, papers: List["Paper"], indent: Optional[int] = None) -> bytes:
+        """
+        Serialize a list of papers to a JSON array in a single pass.
+
+        With ``indent``, the array is laid out as a top-level document. The
+        bytes are not re-indented if embedded in another document, so decode
+        them first when nesting them in indented output.
+        """
+        return PAPER_LIST_ADAPTER.dump_json(papers, indent=indent)
+
+    @classmethod
+    def dump_each(cls, papers: List["Paper"]) -> List[bytes]:
+        """Serialize each paper to its own compact JSON object"""
+        to_json = cls.__pydantic_serializer__.to_json
+        return [to_json(paper) for paper in papers]
+
+
+# Built once so batches reuse the same validator and serializer
+PAPER_LIST_ADAPTER: TypeAdapter[List[Paper]] = TypeAdapter(List[Paper])
+
 
 class PaperDB(SQLModel, table=True):
     """SQLModel version of Paper for database storage"""
 
+    # Serves source filters alone as well as source plus date ranges
+    __table_args__ = (Index("ix_paperdb_source_date", "source", "publication_date"),)
+
     uuid: str = SQLField(primary_key=True, default_factory=lambda: str(uuid.uuid4()))
     title: str
     abstract: Optional[str] = None
-    publication_date: Optional[datetime] = None
+    publication_date: Optional[datetime] = SQLField(default=None, index=True)
     journal: Optional[str] = None
     doi: Optional[str] = SQLField(default=None, unique=True, index=True)
     url: Optional[str] = None
     citations: Optional[int] = None
     source: str = ""
     source_id: Optional[str] = None
+    # Compressed JSON; metadata_json is only read for rows saved before it
+    metadata_blob: Optional[bytes] = None
     metadata_json: Optional[str] = None
 
     # Relationships
-    authors: List[AuthorDB] = Relationship(back_populates="paper")
+    # Authors in the order they are listed on the paper
+    authors: List[AuthorDB] = Relationship(
+        back_populates="paper",
+        sa_relationship_kwargs={"order_by": lambda: [AuthorDB.position, AuthorDB.uuid]},
+    )
     keyword_objects: List[Keyword] = Relationship(back_populates="paper")
 
     @property
@@ -104,25 +150,30 @@ class PaperDB(SQLModel, table=True):
     def keyword_uuids(self) -> List[str]:
         return [k.uuid for k in self.keyword_objects]
 
+    @staticmethod
+    def row_from_paper(paper: Paper) -> Dict[str, Any]:
+        """Build the paperdb column values for a paper"""
+        return {
+            "uuid": paper.uuid,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "publication_date": paper.publication_date,
+            "journal": paper.journal,
+            "doi": paper.doi,
+            "url": paper.url,
+            "citations": paper.citations,
+            "source": paper.source,
+            "source_id": paper.source_id,
+            "metadata_blob": (
+                compress(dumps(paper.metadata)) if paper.metadata else None
+            ),
+        }
+
     @classmethod
     def from_paper(cls, paper: Paper) -> "PaperDB":
         """Convert a Paper to PaperDB"""
-        import json
-
         # Create PaperDB instance
-        paper_db = cls(
-            uuid=paper.uuid,
-            title=paper.title,
-            abstract=paper.abstract,
-            publication_date=paper.publication_date,
-            journal=paper.journal,
-            doi=paper.doi,
-            url=paper.url,
-            citations=paper.citations,
-            source=paper.source,
-            source_id=paper.source_id,
-            metadata_json=json.dumps(paper.metadata) if paper.metadata else None,
-        )
+        paper_db = cls(**cls.row_from_paper(paper))
 
         # Add authors
         paper_db.authors = [
@@ -131,8 +182,9 @@ class PaperDB(SQLModel, table=True):
                 name=author.name,
                 affiliation=author.affiliation,
                 orcid=author.orcid,
+                position=position,
             )
-            for author in paper.authors
+            for position, author in enumerate(paper.authors)
         ]
 
         # Add keywords
@@ -144,8 +196,6 @@ class PaperDB(SQLModel, table=True):
 
     def to_paper(self) -> Paper:
         """Convert PaperDB to Paper"""
-        import json
-
         # Convert authors
         authors = []
         author_uuids = []
@@ -163,11 +213,13 @@ class PaperDB(SQLModel, table=True):
 
         # Extract metadata
         metadata = {}
-        if self.metadata_json:
-            try:
-                metadata = json.loads(self.metadata_json)
-            except json.JSONDecodeError:
-                pass
+        try:
+            if self.metadata_blob:
+                metadata = loads(decompress(self.metadata_blob))
+            elif self.metadata_json:
+                metadata = loads(self.metadata_json)
+        except ValueError as e:  # Decompression and json/orjson decode errors
+            logger.warning(f"Could not read metadata for paper {self.uuid}: {e}")
 
         # Get keyword UUIDs
         keyword_uuids = [k.uuid for k in self.keyword_objects]
@@ -190,3 +242,22 @@ class PaperDB(SQLModel, table=True):
             source_id=self.source_id,
             metadata=metadata,
         )
+
+
+class PaperSummary(NamedTuple):
+    """Lightweight paper row used for display"""
+
+    title: str
+    publication_date: Optional[datetime]
+    authors: List[str]
+    source: str
+
+    @classmethod
+    def from_paper(cls, paper: Paper) -> "PaperSummary":
+        """Summarize a Paper"""
+        return cls(
+            title=paper.title,
+            publication_date=paper.publication_date,
+            authors=[author.name for author in paper.authors],
+            source=paper.source,
+        )
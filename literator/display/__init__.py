@@ -5,6 +5,7 @@ This module provides functionality for displaying query and request results
 in various formats, primarily focused on console output.
 
 Functions:
+    display_stats: Display statistics about the database
     display_query_results: Display the results of database queries
     display_request_results: Display the results of API requests
 
@@ -13,6 +14,10 @@ See Also:
 """
 
 # Expose module
-from literator.display.console import display_request_results, display_query_results
+from literator.display.console import (
+    display_stats,
+    display_request_results,
+    display_query_results,
+)
 
-__all__ = ["display_query_results", "display_request_results"]
+__all__ = ["display_stats", "display_query_results", "display_request_results"]
@@ -1,23 +1,89 @@
 """Display functions for the litreview tool."""
 
-import json
-import os
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import List, Optional, Sequence, Union
 
-from rich.console import Console
+from pydantic import BaseModel, Field
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 
+from literator.utils import list_request_files, parse_timestamp
 from literator.utils.logging import get_logger
 from literator.config import REQUESTS_DIR
-from literator.db import init_db, Paper, Author
+from literator.db import init_db, get_stats, PaperSummary
 
 # Setup console for rich output
 console = Console()
 logger = get_logger(__name__)
 
+# Styles for the request results table, parsed once instead of per table
+_BLUE = Style(color="blue")
+_BOLD_BLUE = Style(color="blue", bold=True)
+_BOLD_CYAN = Style(color="cyan", bold=True)
+_BRIGHT_BLUE = Style(color="bright_blue")
+_BRIGHT_WHITE = Style(color="bright_white")
+_GREEN = Style(color="green")
+_MAGENTA = Style(color="magenta")
+_YELLOW = Style(color="yellow")
+
+
+class _AuthorView(BaseModel):
+    """Author fields shown when viewing request results"""
+
+    name: Optional[str] = None
+
+
+class _PaperView(BaseModel):
+    """Paper fields shown when viewing request results"""
+
+    title: Optional[str] = None
+    publication_date: Optional[datetime] = None
+    authors: List[_AuthorView] = Field(default_factory=list)
+    journal: Optional[str] = None
+
+
+class _RequestResults(BaseModel):
+    """Typed view of a saved request results file"""
+
+    query: str = "Unknown"
+    timestamp: Optional[str] = None
+    start_year: Union[int, str, None] = "N/A"
+    end_year: Union[int, str, None] = "N/A"
+    source: str = "Unknown"
+    papers: List[_PaperView] = Field(default_factory=list)
+    count: Optional[int] = None
+
+
+def _read_request_head(path: Path, count: int) -> _RequestResults:
+    """Read the envelope and first ``count`` papers of an NDJSON results file."""
+    with open(path, "rb") as f:
+        results = _RequestResults.model_validate_json(f.readline())
+        results.papers = [
+            _PaperView.model_validate_json(line) for line in islice(f, count)
+        ]
+    return results
+
+
+def _publication_year(
+    paper: Union[PaperSummary, _PaperView], default: str
+) -> str:
+    """Get the publication year of a paper as a string."""
+    return str(paper.publication_date.year) if paper.publication_date else default
+
+
+def _format_authors(
+    names: Sequence[Optional[str]], limit: int, default: str = ""
+) -> str:
+    """Join the first few author names, adding "et al." when truncated."""
+    if not names:
+        return default
+    joined = ", ".join(name or "Unknown" for name in islice(names, limit))
+    return f"{joined} et al." if len(names) > limit else joined
+
 
 def display_stats():
     """Display statistics about the database"""
@@ -25,11 +91,7 @@ def display_stats():
         init_db()  # Ensure database is initialized
         stats = get_stats()
 
-        console.print("\n[bold blue]Database Statistics[/bold blue]")
-        console.print(f"Total papers: {stats['total_papers']}")
-        console.print(f"Total authors: {stats['total_authors']}")
-
-        # Display papers by source in a table
+        # Build papers by source table
         table = Table(title="Papers by Source")
         table.add_column("Source")
         table.add_column("Count")
@@ -37,42 +99,66 @@ def display_stats():
         for source, count in stats["papers_by_source"].items():
             table.add_row(source, str(count))
 
-        console.print(table)
+        # Build top keywords as a single block of text
+        keyword_lines = "\n".join(
+            f"  {kw}: {count}" for kw, count in stats["top_keywords"].items()
+        )
 
-        # Display top keywords
-        console.print("\n[bold]Top Keywords:[/bold]")
-        for kw, count in stats["top_keywords"].items():
-            console.print(f"  {kw}: {count}")
+        # Render everything in one print
+        console.print(
+            Group(
+                "\n[bold blue]Database Statistics[/bold blue]",
+                f"Total papers: {stats['total_papers']}",
+                f"Total authors: {stats['total_authors']}",
+                table,
+                "\n[bold]Top Keywords:[/bold]",
+                keyword_lines,
+            )
+        )
 
     except Exception as e:
         logger.error(f"Error getting statistics: {str(e)}")
 
 
-def display_query_results(papers: List[Paper]):
-    """Display query results in a nicely formatted table"""
+def display_query_results(
+    papers: List[PaperSummary], total: Optional[int] = None, limit: int = 10
+):
+    """
+    Display query results in a nicely formatted table
+
+    Args:
+        papers: Papers to display, of which the first ``limit`` are shown
+        total: Number of matching papers, if more were found than passed in
+        limit: Maximum number of papers to show
+    """
+    if total is None:
+        total = len(papers)
+
     # Display results in a table
     table = Table(title="Search Results")
-    table.add_column("Title")
+    # Let rich truncate long titles while measuring the cell
+    table.add_column("Title", max_width=50, no_wrap=True, overflow="ellipsis")
     table.add_column("Year")
     table.add_column("Authors")
     table.add_column("Source")
 
-    for paper in papers[:10]:  # Show first 10 papers
-        pub_year = paper.publication_date.year if paper.publication_date else "Unknown"
-        authors = ", ".join([a.name for a in paper.authors[:3]])
-        if len(paper.authors) > 3:
-            authors += " et al."
-        table.add_row(
-            paper.title[:50] + "..." if len(paper.title) > 50 else paper.title,
-            str(pub_year),
-            authors,
+    # Build all rows up front, showing the first few papers
+    rows = [
+        (
+            paper.title,
+            _publication_year(paper, "Unknown"),
+            _format_authors(paper.authors, 3),
             paper.source,
         )
+        for paper in papers[:limit]
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
-    if len(papers) > 10:
-        console.print(f"[italic](Showing 10 of {len(papers)} results)[/italic]")
+    if total > limit:
+        console.print(f"[italic](Showing {limit} of {total} results)[/italic]")
 
 
 def display_request_results(file: Optional[str] = None, count: int = 10):
@@ -84,14 +170,14 @@ def display_request_results(file: Optional[str] = None, count: int = 10):
                 console.print("[yellow]No requests directory found.[/yellow]")
                 return
 
-            files = list(REQUESTS_DIR.glob("scopus_*.json"))
-            if not files:
+            entries = list_request_files(REQUESTS_DIR, "scopus")
+            if not entries:
                 console.print("[yellow]No recent search results found.[/yellow]")
                 return
 
-            # Sort by modification time, newest first
-            files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            file = str(files[0])
+            # Timestamped names sort chronologically, so the newest file is
+            # the largest name and no stat calls are needed
+            file = max(entries, key=lambda e: e.name).path
 
         # Convert to Path if string
         if isinstance(file, str):
@@ -103,24 +189,26 @@ def display_request_results(file: Optional[str] = None, count: int = 10):
             console.print(f"[red]File not found: {file_path}[/red]")
             return
 
-        # Read the JSON file
-        with open(file_path, "r", encoding="utf-8") as f:
-            results_dict: Dict[str, Any] = json.load(f)
-
-        # Load results values
-        query: str = results_dict.get("query", "Unknown")
-        timestamp: Optional[str] = results_dict.get("timestamp")
-        if timestamp:
-            timestamp_str = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-            timestamp = timestamp_str.strftime("%Y-%m-%d %H:%M:%S")
+        # Only the first papers are shown, so prefer the NDJSON sidecar which
+        # can be read line by line instead of parsing the whole file
+        ndjson_path = file_path.with_suffix(".ndjson")
+        if ndjson_path.exists():
+            results = _read_request_head(ndjson_path, count)
         else:
-            timestamp = "Unknown"
-        start_year: str = results_dict.get("start_year", "N/A")
-        end_year: str = results_dict.get("end_year", "N/A")
-        source: str = results_dict.get("source", "Unknown")
+            # Parse and validate only the fields we display in a single pass
+            results = _RequestResults.model_validate_json(file_path.read_bytes())
+        total = results.count if results.count is not None else len(results.papers)
 
-        papers_list = results_dict.get("papers", [])
-        papers: List[Paper] = [Paper(**paper_dict) for paper_dict in papers_list]
+        # Load results values
+        query = results.query
+        timestamp = "Unknown"
+        if results.timestamp:
+            timestamp_str = parse_timestamp(results.timestamp)
+            timestamp = timestamp_str.isoformat(sep=" ")
+        start_year = results.start_year
+        end_year = results.end_year
+        source = results.source
+        papers = results.papers
 
         # Display basic info with colors
         console.print(
@@ -128,7 +216,7 @@ def display_request_results(file: Optional[str] = None, count: int = 10):
                 "\n".join(
                     [
                         f"[bold blue]Request file:[/bold blue] [cyan]{file_path}[/cyan]",
-                        f"[bold blue]Total papers:[/bold blue] [green]{len(papers)}[/green]",
+                        f"[bold blue]Total papers:[/bold blue] [green]{total}[/green]",
                         f"[bold blue]Query:[/bold blue] '[yellow]{query}[/yellow]'",
                         f"[bold blue]Timestamp:[/bold blue] [magenta]{timestamp}[/magenta]",
                         f"[bold blue]Source:[/bold blue] [yellow]{source.capitalize()}[/yellow]",
@@ -144,56 +232,39 @@ def display_request_results(file: Optional[str] = None, count: int = 10):
         # Show papers in a table with improved styling and word wrap
         table = Table(
             title="Papers Summary",
-            title_style="bold blue",
-            header_style="bold cyan",
-            border_style="bright_blue",
+            title_style=_BOLD_BLUE,
+            header_style=_BOLD_CYAN,
+            border_style=_BRIGHT_BLUE,
             show_lines=True,  # Add lines between rows for better readability
         )
-        table.add_column("#", style="magenta", width=3, justify="right")
-        table.add_column("Title", style="bright_white", width=40, overflow="fold")
-        table.add_column("Year", style="green", width=6, justify="center")
-        table.add_column("Authors", width=30, style="yellow")
-        table.add_column("Journal", width=30, style="blue", overflow="fold")
-
-        for i, paper in enumerate(papers[:count]):
-            # Extract data from the paper dict
-            title = paper.title or "Unknown"
-
-            # Get year from publication date
-            year = "?"
-            if paper.publication_date:
-                pub_date = str(paper.publication_date)
-                try:
-                    year = pub_date.split("-")[0]  # Get year from YYYY-MM-DD
-                except (IndexError, AttributeError):
-                    pass
-
-            # Format authors
-            authors = "Unknown"
-            paper_authors: List[Author] = paper.authors or []
-            if paper_authors:
-                author_names = [
-                    author.name or "Unknown" for author in paper_authors[:2]
-                ]
-                authors = ", ".join(author_names)
-                if len(paper_authors) > 2:
-                    authors += " et al."
-
-            # Format journal - don't truncate, let rich handle wrapping
-            journal: str = paper.journal or "Unknown"
-
-            # Format number
-            row_num = str(i + 1)
-            if len(row_num) > 3:
-                row_num = row_num[-3:]
-
-            table.add_row(row_num, title, year, authors, journal)
+        table.add_column("#", style=_MAGENTA, width=3, justify="right")
+        table.add_column("Title", style=_BRIGHT_WHITE, width=40, overflow="fold")
+        table.add_column("Year", style=_GREEN, width=6, justify="center")
+        table.add_column("Authors", width=30, style=_YELLOW)
+        table.add_column("Journal", width=30, style=_BLUE, overflow="fold")
+
+        # Build all rows up front; rich handles wrapping of long journals
+        rows = [
+            (
+                str(i)[-3:],
+                paper.title or "Unknown",
+                _publication_year(paper, "?"),
+                # One name past the limit is enough to know to add "et al."
+                _format_authors(
+                    [author.name for author in islice(paper.authors, 3)], 2, "Unknown"
+                ),
+                paper.journal or "Unknown",
+            )
+            for i, paper in enumerate(papers[:count], start=1)
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
-        if len(papers) > count:
+        if total > count:
             console.print(
-                f"[dim italic](Showing {count} of {len(papers)} papers)[/dim italic]"
+                f"[dim italic](Showing {count} of {total} papers)[/dim italic]"
             )
 
     except Exception as e:
@@ -18,7 +18,13 @@ from literator.utils.errors import (
     FlagsEmptyError,
     FlagTypeError,
 )
-from literator.utils.functions import get_timestamp, str_to_datetime, format_phrases
+from literator.utils.functions import (
+    get_timestamp,
+    list_request_files,
+    str_to_datetime,
+    parse_timestamp,
+    format_phrase,
+)
 from literator.utils.logging import setup_logging, get_logger
 from literator.utils.types import (
     Date,
@@ -53,8 +59,10 @@ __all__ = [
     "FlagTypeError",
     # Functions
     "get_timestamp",
+    "list_request_files",
     "str_to_datetime",
-    "format_phrases",
+    "parse_timestamp",
+    "format_phrase",
     "setup_logging",
     "get_logger",
     # Types
@@ -1,9 +1,18 @@
+import functools
+import os
+import re
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
 
 SQUOTE = "'"
 DQUOTE = '"'
 SPACE = " "
 COMMA = ","
+QUOTES = (SQUOTE, DQUOTE)
+
+# Matches the default get_timestamp() format, YYYYMMDD_HHMMSS
+TIMESTAMP_RE = re.compile(r"(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})")
 
 
 def get_timestamp(pattern: str = "%Y%m%d_%H%M%S") -> str:
@@ -11,15 +20,44 @@ def get_timestamp(pattern: str = "%Y%m%d_%H%M%S") -> str:
     return datetime.now(timezone.utc).strftime(pattern)
 
 
+def list_request_files(directory: Path, source: str = "scopus") -> List[os.DirEntry]:
+    """
+    List the saved request files for a source in a directory.
+
+    Matches ``<source>_*.json`` with plain prefix/suffix checks on
+    ``os.scandir`` entries, which avoids building a Path per entry.
+    """
+    prefix = f"{source}_"
+    with os.scandir(directory) as it:
+        return [e for e in it if e.name.startswith(prefix) and e.name.endswith(".json")]
+
+
+@functools.lru_cache(maxsize=4096)
 def str_to_datetime(timestamp: str, pattern: str = "%Y%m%d_%H%M%S") -> datetime:
+    """Parse a timestamp string, caching results for repeated inputs."""
     return datetime.strptime(timestamp, pattern)
 
 
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse a timestamp made by get_timestamp() with its default pattern.
+
+    Uses a precompiled regex and integer conversion instead of strptime.
+
+    Raises:
+        ValueError: If the timestamp is not in YYYYMMDD_HHMMSS form
+    """
+    match = TIMESTAMP_RE.fullmatch(timestamp)
+    if match is None:
+        raise ValueError(f"Timestamp {timestamp!r} does not match YYYYMMDD_HHMMSS")
+    return datetime(*map(int, match.groups()))
+
+
 def format_phrase(value: str, exact: bool = False) -> str:
     strip_val = value.strip()
-    wrapped = (strip_val.startswith(SQUOTE) and strip_val.endswith(SQUOTE)) or (
-        strip_val.startswith(DQUOTE) and strip_val.endswith(DQUOTE)
-    )
+    # Compare the leading character once instead of probing each quote type
+    head = strip_val[:1]
+    wrapped = head in QUOTES and strip_val.endswith(head)
     if not wrapped and (exact or SPACE in value or COMMA in value):
         return f'"{strip_val}"'
     else:
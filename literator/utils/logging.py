@@ -1,6 +1,10 @@
 """Logging configuration for the literator package."""
 
+import functools
+import io
 import logging
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
@@ -13,11 +17,55 @@ import appdirs
 DEFAULT_LOG_LEVEL = logging.INFO
 DEFAULT_DEBUG_LOG_LEVEL = logging.DEBUG
 
+# Shared console, created on first use
+_CONSOLE: Optional[Console] = None
 
+
+class AppendFileHandler(logging.FileHandler):
+    """
+    File handler that writes UTF-8 encoded records straight to an append-only
+    file descriptor, skipping the text-mode wrapper used by FileHandler.
+    """
+
+    _FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+
+    def __init__(self, filename: Union[str, Path], delay: bool = False):
+        super().__init__(filename, mode="a", encoding="utf-8", delay=delay)
+
+    def _open(self) -> io.BufferedWriter:
+        fd = os.open(self.baseFilename, self._FLAGS, 0o644)
+        return io.BufferedWriter(io.FileIO(fd, mode="a"), buffer_size=65536)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode("utf-8"))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def get_console() -> Console:
+    """
+    Get the shared Rich console, creating it on first use so the terminal
+    probing happens once per process.
+    """
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+@functools.lru_cache(maxsize=1)
 def get_log_dir() -> Path:
     """
     Get the appropriate directory for storing log files.
-    Uses appdirs to get the system's appropriate log directory.
+    Uses appdirs to get the system's appropriate log directory. The result is
+    cached, so the directory is only resolved and created once per process.
     """
     app_name = "literator"
     app_author = "literator"
@@ -60,24 +108,35 @@ def setup_logging(
     console_level = DEFAULT_DEBUG_LOG_LEVEL if debug else DEFAULT_LOG_LEVEL
     file_level = DEFAULT_DEBUG_LOG_LEVEL  # Always log debug to file
 
-    # Set the overall logger level to the most verbose needed
-    logger.setLevel(min(console_level, file_level))
+    # Set the overall logger level to the most verbose needed by an enabled
+    # handler, so filtered records are dropped before any formatting
+    logger.setLevel(min(console_level, file_level) if log_to_file else console_level)
 
     handlers = []
 
-    # Configure console handler with Rich formatting
+    # Configure console handler with Rich formatting on a terminal, and a
+    # plain stream handler when output is redirected (pipes, CI, journals)
     if log_to_console:
-        console = Console()
-        rich_handler = RichHandler(
-            level=console_level,
-            console=console,
-            rich_tracebacks=True,
-            tracebacks_show_locals=debug,
-            show_time=True,
-            show_path=debug,
-        )
-        rich_handler.setFormatter(logging.Formatter("%(message)s"))
-        handlers.append(rich_handler)
+        if sys.stdout.isatty():
+            # Dumping frame locals can be very expensive, so require an
+            # explicit opt-in on top of the debug flag
+            show_locals = debug and os.environ.get("LITERATOR_RICH_LOCALS") == "1"
+            console_handler = RichHandler(
+                level=console_level,
+                console=get_console(),
+                rich_tracebacks=True,
+                tracebacks_show_locals=show_locals,
+                show_time=True,
+                show_path=debug,
+            )
+            console_handler.setFormatter(logging.Formatter("%(message)s"))
+        else:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(console_level)
+            console_handler.setFormatter(
+                logging.Formatter("%(levelname)s %(message)s")
+            )
+        handlers.append(console_handler)
 
     # Configure file handler if requested
     if log_to_file:
@@ -95,7 +154,7 @@ def setup_logging(
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Create file handler
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = AppendFileHandler(log_file)
         file_handler.setLevel(file_level)
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
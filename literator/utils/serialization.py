@@ -0,0 +1,96 @@
+"""JSON serialization helpers, using orjson and zstandard when installed."""
+
+import zlib
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    import json
+
+    HAS_ORJSON = False
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Leading bytes of every zstd frame, used to tell compressed formats apart
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types the stdlib json module does not handle."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value)} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with a two space indent
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None, default=_default
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document from bytes or a string."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def compress(data: bytes) -> bytes:
+    """
+    Compress bytes with zstd, or with zlib if zstandard is not installed.
+
+    Args:
+        data: Bytes to compress
+
+    Returns:
+        Compressed bytes, readable by decompress()
+    """
+    if HAS_ZSTD:
+        return zstandard.compress(data, 3)
+    return zlib.compress(data, 6)
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    Decompress bytes produced by compress(), whichever codec was used.
+
+    Raises:
+        ValueError: If the data is corrupt, or is zstd compressed and
+            zstandard is not installed
+    """
+    if data.startswith(ZSTD_MAGIC):
+        if not HAS_ZSTD:
+            raise ValueError(
+                "zstandard is required to read zstd compressed data, "
+                "install literator[fast]"
+            )
+        try:
+            return zstandard.decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd data: {e}") from e
+
+    try:
+        return zlib.decompress(data)
+    except zlib.error as e:
+        raise ValueError(f"Invalid zlib data: {e}") from e
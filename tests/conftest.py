@@ -0,0 +1,13 @@
+"""Test configuration, run before literator is imported."""
+
+import os
+import tempfile
+
+# literator reads its settings and creates its database and vault when it is
+# imported, so point them all at a scratch directory first
+_SCRATCH = tempfile.mkdtemp(prefix="literator-tests-")
+os.environ["HOME"] = _SCRATCH
+os.environ["XDG_DATA_HOME"] = os.path.join(_SCRATCH, "data")
+os.environ["VAULT_PATH"] = os.path.join(_SCRATCH, "vault")
+os.environ.setdefault("SCOPUS_API_KEY", "test-key")
+os.environ.setdefault("SCOPUS_API_URL", "https://api.elsevier.com/content/search")
@@ -0,0 +1,128 @@
+"""Reading a database created before the current schema."""
+
+import sqlite3
+
+import pytest
+
+from literator.core import query_database
+from literator.db import handler
+from literator.db import count_papers, get_paper_summaries, get_papers_from_db
+
+# Schema written by the first release, before metadata_blob, AuthorDB.position,
+# the extra indexes and the full-text index were added
+BASELINE_SCHEMA = """
+CREATE TABLE paperauthorlink (
+    paper_uuid VARCHAR NOT NULL,
+    author_uuid VARCHAR NOT NULL,
+    PRIMARY KEY (paper_uuid, author_uuid)
+);
+CREATE TABLE paperdb (
+    uuid VARCHAR NOT NULL,
+    title VARCHAR NOT NULL,
+    abstract VARCHAR,
+    publication_date DATETIME,
+    journal VARCHAR,
+    doi VARCHAR,
+    url VARCHAR,
+    citations INTEGER,
+    source VARCHAR NOT NULL,
+    source_id VARCHAR,
+    metadata_json VARCHAR,
+    PRIMARY KEY (uuid)
+);
+CREATE UNIQUE INDEX ix_paperdb_doi ON paperdb (doi);
+CREATE TABLE authordb (
+    uuid VARCHAR NOT NULL,
+    name VARCHAR NOT NULL,
+    affiliation VARCHAR,
+    orcid VARCHAR,
+    paper_id VARCHAR,
+    PRIMARY KEY (uuid),
+    FOREIGN KEY(paper_id) REFERENCES paperdb (uuid)
+);
+CREATE TABLE keyword (
+    uuid VARCHAR NOT NULL,
+    keyword VARCHAR NOT NULL,
+    paper_id VARCHAR,
+    PRIMARY KEY (uuid),
+    FOREIGN KEY(paper_id) REFERENCES paperdb (uuid)
+);
+CREATE INDEX ix_keyword_keyword ON keyword (keyword);
+"""
+
+
+@pytest.fixture
+def baseline_db(monkeypatch):
+    """Replace the database with one in the baseline schema holding two papers"""
+    handler.engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        handler.DB_PATH.with_name(handler.DB_PATH.name + suffix).unlink(
+            missing_ok=True
+        )
+
+    connection = sqlite3.connect(handler.DB_PATH)
+    connection.executescript(BASELINE_SCHEMA)
+    connection.executemany(
+        "INSERT INTO paperdb (uuid, title, abstract, publication_date, doi, "
+        "source, metadata_json) VALUES (?, ?, ?, ?, ?, 'scopus', ?)",
+        [
+            (
+                "paper-1",
+                "Neural networks for radio astronomy",
+                "Calibration with deep learning",
+                "2021-03-01 00:00:00.000000",
+                "10.1000/one",
+                '{"eid": "2-s2.0-1"}',
+            ),
+            (
+                "paper-2",
+                "Sparse imaging",
+                None,
+                "2019-06-01 00:00:00.000000",
+                "10.1000/two",
+                None,
+            ),
+        ],
+    )
+    connection.executemany(
+        "INSERT INTO authordb (uuid, name, paper_id) VALUES (?, ?, ?)",
+        [
+            ("author-1", "Zulu", "paper-1"),
+            ("author-2", "Alpha", "paper-1"),
+            ("author-3", "Mike", "paper-2"),
+        ],
+    )
+    connection.executemany(
+        "INSERT INTO paperauthorlink (paper_uuid, author_uuid) VALUES (?, ?)",
+        [("paper-1", "author-1"), ("paper-1", "author-2"), ("paper-2", "author-3")],
+    )
+    connection.commit()
+    connection.close()
+
+    monkeypatch.setattr(handler, "_DB_READY", False)
+    monkeypatch.setattr(handler, "_FTS_READY", None)
+    yield
+    handler.engine.dispose()
+
+
+def test_get_papers_from_baseline_db(baseline_db):
+    papers = get_papers_from_db()
+
+    assert [paper.uuid for paper in papers] == ["paper-1", "paper-2"]
+    assert [author.name for author in papers[0].authors] == ["Zulu", "Alpha"]
+    assert papers[0].author_uuids == ["author-1", "author-2"]
+    assert papers[0].metadata == {"eid": "2-s2.0-1"}
+
+
+def test_query_database_on_baseline_db(baseline_db):
+    papers = query_database("neural", print_results=False)
+
+    assert [paper.uuid for paper in papers] == ["paper-1"]
+
+
+def test_summaries_on_baseline_db(baseline_db):
+    summaries = get_paper_summaries("imaging")
+
+    assert [summary.title for summary in summaries] == ["Sparse imaging"]
+    assert summaries[0].authors == ["Mike"]
+    assert count_papers() == 2